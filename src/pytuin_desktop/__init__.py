@@ -1,7 +1,7 @@
 # src/pytuin_desktop/__init__.py
 from __future__ import annotations
 
-from pytuin_desktop.parser import AtrbParser
+from pytuin_desktop.parser import AtrbParser, clear_parse_cache
 from pytuin_desktop.writer import AtrbWriter
 from pytuin_desktop.builders import BlockBuilder
 from pytuin_desktop.editor import DocumentEditor
@@ -26,6 +26,7 @@ __version__ = "0.1.0"
 
 __all__ = [
     "AtrbParser",
+    "clear_parse_cache",
     "AtrbWriter",
     "BlockBuilder",
     "DocumentEditor",
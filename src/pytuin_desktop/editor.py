@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from uuid import uuid4
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
 from pytuin_desktop.models.document import AtrbDocument
 from pytuin_desktop.models.blocks import AnyBlock
@@ -17,14 +17,19 @@ class DocumentEditor:
     def __init__(self, document: AtrbDocument):
         """Initialize editor with a document."""
         self.document = document
-        self._block_index: dict[str, tuple[int, AnyBlock]] = {}
-        self._rebuild_index()
+        self._block_index: dict[str, tuple[int, AnyBlock]] | None = None
 
-    def _rebuild_index(self) -> None:
-        """Rebuild the block ID index for fast lookups."""
-        self._block_index.clear()
-        for i, block in enumerate(self.document.content):
-            self._block_index[str(block.id)] = (i, block)
+    def _get_index(self) -> dict[str, tuple[int, AnyBlock]]:
+        """Return the block ID index, building it on first use after a change."""
+        if self._block_index is None:
+            self._block_index = {
+                str(block.id): (i, block) for i, block in enumerate(self.document.content)
+            }
+        return self._block_index
+
+    def _invalidate_index(self) -> None:
+        """Mark the block ID index stale after a structural change."""
+        self._block_index = None
 
     @classmethod
     def from_file(cls, filepath: str | Path) -> DocumentEditor:
@@ -54,26 +59,43 @@ class DocumentEditor:
         """Add a block to the document."""
         if index is None:
             self.document.content.append(block)
-            self._block_index[str(block.id)] = (len(self.document.content) - 1, block)
+            if self._block_index is not None:
+                self._block_index[str(block.id)] = (len(self.document.content) - 1, block)
         else:
             self.document.content.insert(index, block)
-            self._rebuild_index()
+            self._invalidate_index()
+        return self
+
+    def extend_blocks(self, blocks: Iterable[AnyBlock]) -> DocumentEditor:
+        """Append several blocks to the end of the document."""
+        self.document.content.extend(blocks)
+        self._invalidate_index()
         return self
 
     def remove_block(self, block_id: str) -> DocumentEditor:
         """Remove a block by ID. Raises ValueError if block not found."""
-        if block_id not in self._block_index:
+        block_index = self._get_index()
+        if block_id not in block_index:
             raise ValueError(f"Block with id {block_id} not found")
-        index, _ = self._block_index[block_id]
+        index, _ = block_index[block_id]
         del self.document.content[index]
-        self._rebuild_index()
+        self._invalidate_index()
         return self
 
     def remove_block_at(self, index: int) -> DocumentEditor:
         """Remove a block at the specified index."""
         if 0 <= index < len(self.document.content):
             del self.document.content[index]
-            self._rebuild_index()
+            self._invalidate_index()
+        return self
+
+    def truncate(self, length: int) -> DocumentEditor:
+        """Keep only the first `length` blocks."""
+        if length < 0:
+            raise ValueError(f"Cannot truncate to negative length {length}")
+        if length < len(self.document.content):
+            del self.document.content[length:]
+            self._invalidate_index()
         return self
 
     def get_block(self, index: int) -> AnyBlock:
@@ -86,24 +108,28 @@ class DocumentEditor:
     #    return result[1] if result else None
     def find_block(self, block_id: str) -> tuple[int, AnyBlock] | None:
         """Find block by ID. Returns (index, block) or None."""
-        return self._block_index.get(block_id)
+        return self._get_index().get(block_id)
 
     def find_block_by_id(self, block_id: str) -> tuple[int, AnyBlock] | None:
         """Find block by ID. Returns (index, block) or None."""
-        return self._block_index.get(block_id)
+        return self._get_index().get(block_id)
 
     def move_block(self, from_index: int, to_index: int) -> DocumentEditor:
         """Move a block from one index to another."""
+        if from_index == to_index:
+            return self
         if 0 <= from_index < len(self.document.content) and 0 <= to_index < len(
             self.document.content
         ):
             block = self.document.content.pop(from_index)
             self.document.content.insert(to_index, block)
-            self._rebuild_index()
+            self._invalidate_index()
         return self
 
     def swap_blocks(self, index1: int, index2: int) -> DocumentEditor:
         """Swap two blocks."""
+        if index1 == index2:
+            return self
         if 0 <= index1 < len(self.document.content) and 0 <= index2 < len(
             self.document.content
         ):
@@ -111,7 +137,7 @@ class DocumentEditor:
                 self.document.content[index2],
                 self.document.content[index1],
             )
-            self._rebuild_index()
+            self._invalidate_index()
         return self
 
     def save(self, filepath: str | Path) -> None:
@@ -144,17 +170,20 @@ class DocumentEditor:
         """
         for block in self.document.content:
             yield (block, None)
-            if include_nested and hasattr(block, "children") and block.children:
-                yield from self._walk_children(block.children, depth=0)
-
-    def _walk_children(
-        self, children: list[AnyBlock], depth: int
-    ) -> Iterator[tuple[AnyBlock, int]]:
-        """Recursively walk children blocks."""
-        for child in children:
-            yield (child, depth)
-            if hasattr(child, "children") and child.children:
-                yield from self._walk_children(child.children, depth + 1)
+            if not include_nested or not getattr(block, "children", None):
+                continue
+
+            # Depth-first over an explicit stack of sibling iterators
+            stack = [(iter(block.children), 0)]
+            while stack:
+                siblings, depth = stack[-1]
+                child = next(siblings, None)
+                if child is None:
+                    stack.pop()
+                    continue
+                yield (child, depth)
+                if getattr(child, "children", None):
+                    stack.append((iter(child.children), depth + 1))
 
     def flatten_blocks(self) -> list[AnyBlock]:
         """Return a flat list of all blocks including nested children."""
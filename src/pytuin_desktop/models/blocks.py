@@ -1,9 +1,9 @@
 # src/pytuin_desktop/models/blocks.py
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal, Union
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 
 from pytuin_desktop.models.base import BaseBlock
 from pytuin_desktop.models.content import InlineContent, TableContent
@@ -231,35 +231,46 @@ class FileBlock(BaseBlock):
     props: FileProps
 
 
-AnyBlock = (
-    ParagraphBlock
-    | HeadingBlock
-    | HorizontalRuleBlock
-    | EditorBlock
-    | ScriptBlock
-    | RunBlock
-    | EnvBlock
-    | VarBlock
-    | LocalVarBlock
-    | VarDisplayBlock
-    | DirectoryBlock
-    | LocalDirectoryBlock
-    | DropdownBlock
-    | SQLiteBlock
-    | PostgresBlock
-    | HttpBlock
-    | QuoteBlock
-    | ToggleListItemBlock
-    | NumberedListItemBlock
-    | BulletListItemBlock
-    | CheckListItemBlock
-    | CodeBlockBlock
-    | TableBlock
-    | ImageBlock
-    | VideoBlock
-    | AudioBlock
-    | FileBlock
-)
+def _block_tag(value: Any) -> str | None:
+    """Discriminator for AnyBlock; blocks without a `type` key parse as paragraphs."""
+    if isinstance(value, dict):
+        return value.get("type", "paragraph")
+    return getattr(value, "type", None)
+
+
+# Tagged on `type` so validation dispatches straight to one member
+AnyBlock = Annotated[
+    Union[
+        Annotated[ParagraphBlock, Tag("paragraph")],
+        Annotated[HeadingBlock, Tag("heading")],
+        Annotated[HorizontalRuleBlock, Tag("horizontal_rule")],
+        Annotated[EditorBlock, Tag("editor")],
+        Annotated[ScriptBlock, Tag("script")],
+        Annotated[RunBlock, Tag("run")],
+        Annotated[EnvBlock, Tag("env")],
+        Annotated[VarBlock, Tag("var")],
+        Annotated[LocalVarBlock, Tag("local-var")],
+        Annotated[VarDisplayBlock, Tag("var_display")],
+        Annotated[DirectoryBlock, Tag("directory")],
+        Annotated[LocalDirectoryBlock, Tag("local-directory")],
+        Annotated[DropdownBlock, Tag("dropdown")],
+        Annotated[SQLiteBlock, Tag("sqlite")],
+        Annotated[PostgresBlock, Tag("postgres")],
+        Annotated[HttpBlock, Tag("http")],
+        Annotated[QuoteBlock, Tag("quote")],
+        Annotated[ToggleListItemBlock, Tag("toggleListItem")],
+        Annotated[NumberedListItemBlock, Tag("numberedListItem")],
+        Annotated[BulletListItemBlock, Tag("bulletListItem")],
+        Annotated[CheckListItemBlock, Tag("checkListItem")],
+        Annotated[CodeBlockBlock, Tag("codeBlock")],
+        Annotated[TableBlock, Tag("table")],
+        Annotated[ImageBlock, Tag("image")],
+        Annotated[VideoBlock, Tag("video")],
+        Annotated[AudioBlock, Tag("audio")],
+        Annotated[FileBlock, Tag("file")],
+    ],
+    Discriminator(_block_tag),
+]
 
 
 # Update forward references for recursive types
@@ -1,6 +1,8 @@
 # src/pytuin_desktop/models/dependency.py
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
 
 
@@ -26,9 +28,7 @@ class DependencySpec(BaseModel):
 
     def to_json_string(self) -> str:
         """Convert to JSON string for storage."""
-        import json
-
-        return json.dumps(self.model_dump(exclude_defaults=True))
+        return _dependency_json(tuple(self.blocks), tuple(self.variables))
 
     def is_empty(self) -> bool:
         """Check if this dependency spec has any dependencies."""
@@ -53,3 +53,16 @@ class DependencySpec(BaseModel):
         """Remove a variable dependency."""
         if variable_name in self.variables:
             self.variables.remove(variable_name)
+
+
+@lru_cache(maxsize=256)
+def _dependency_json(blocks: tuple[str, ...], variables: tuple[str, ...]) -> str:
+    """Memoized JSON encoding of dependency contents, omitting empty lists."""
+    import json
+
+    data: dict[str, list[str]] = {}
+    if blocks:
+        data["blocks"] = list(blocks)
+    if variables:
+        data["variables"] = list(variables)
+    return json.dumps(data)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from typing import Any, Literal
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from pytuin_desktop.models.dependency import DependencySpec
 
 
@@ -59,6 +59,13 @@ class ScriptProps(BaseModel):
             return DependencySpec(**v)
         return v
 
+    @field_serializer("dependency", when_used="json")
+    def serialize_dependency(self, v):
+        """Store dependency as its JSON string form."""
+        if isinstance(v, DependencySpec):
+            return v.to_json_string()
+        return v
+
 
 class RunProps(BaseModel):
     """Props for terminal/run blocks."""
@@ -83,6 +90,13 @@ class RunProps(BaseModel):
             return DependencySpec(**v)
         return v
 
+    @field_serializer("dependency", when_used="json")
+    def serialize_dependency(self, v):
+        """Store dependency as its JSON string form."""
+        if isinstance(v, DependencySpec):
+            return v.to_json_string()
+        return v
+
 
 class EnvProps(BaseModel):
     """Props for environment variable blocks."""
@@ -153,6 +167,13 @@ class SQLiteProps(BaseModel):
             return DependencySpec(**v)
         return v
 
+    @field_serializer("dependency", when_used="json")
+    def serialize_dependency(self, v):
+        """Store dependency as its JSON string form."""
+        if isinstance(v, DependencySpec):
+            return v.to_json_string()
+        return v
+
 
 class PostgresProps(BaseModel):
     """Props for PostgreSQL query blocks."""
@@ -175,6 +196,13 @@ class PostgresProps(BaseModel):
             return DependencySpec(**v)
         return v
 
+    @field_serializer("dependency", when_used="json")
+    def serialize_dependency(self, v):
+        """Store dependency as its JSON string form."""
+        if isinstance(v, DependencySpec):
+            return v.to_json_string()
+        return v
+
 
 class HttpProps(BaseModel):
     """Props for HTTP request blocks."""
@@ -196,6 +224,13 @@ class HttpProps(BaseModel):
             return DependencySpec(**v)
         return v
 
+    @field_serializer("dependency", when_used="json")
+    def serialize_dependency(self, v):
+        """Store dependency as its JSON string form."""
+        if isinstance(v, DependencySpec):
+            return v.to_json_string()
+        return v
+
 
 class CheckListProps(TextProps):
     """Props for checklist item blocks."""
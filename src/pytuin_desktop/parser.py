@@ -1,13 +1,41 @@
 # src/pytuin_desktop/parser.py
 from __future__ import annotations
 
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 import yaml
+from pydantic import TypeAdapter
 
 from pytuin_desktop.models.document import AtrbDocument
 from pytuin_desktop.models.blocks import AnyBlock
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_BLOCK_ADAPTER = TypeAdapter(AnyBlock)
+
+
+@lru_cache(maxsize=128)
+def _load_file_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Load a file's YAML data; keyed on stat data so edits on disk miss the cache.
+
+    The data is kept pickled so every call unpickles a private copy; props values
+    typed Any would otherwise share nested objects with the cache.
+    """
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached AtrbParser.parse_file data."""
+    _load_file_cached.cache_clear()
+
 
 class AtrbParser:
     """Parser for .atrb files into Pydantic models."""
@@ -23,10 +51,10 @@ class AtrbParser:
         Returns:
             AtrbDocument: Parsed document with typed blocks
         """
-        filepath = Path(filepath)
-        with filepath.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
+        filepath = Path(filepath).resolve()
+        stat = filepath.stat()
+        # Only the YAML load is cached; validation is cheap and yields fresh models
+        data = pickle.loads(_load_file_cached(str(filepath), stat.st_mtime_ns, stat.st_size))
         return AtrbParser._parse_document(data)
 
     @staticmethod
@@ -40,34 +68,49 @@ class AtrbParser:
         Returns:
             AtrbDocument: Parsed document with typed blocks
         """
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
+        return AtrbParser._parse_document(data)
+
+    @staticmethod
+    def parse_stream(stream: TextIO) -> AtrbDocument:
+        """
+        Parse .atrb content from an open text stream.
+
+        Args:
+            stream: Readable text stream, e.g. an open file or io.StringIO
+
+        Returns:
+            AtrbDocument: Parsed document with typed blocks
+        """
+        data = yaml.load(stream, Loader=_YamlLoader)
         return AtrbParser._parse_document(data)
 
     @staticmethod
     def _parse_document(data: dict[str, Any]) -> AtrbDocument:
         """Parse document data with discriminated union for blocks."""
-        content_blocks = []
-        for block_data in data.get("content", []):
-            parsed_block = AtrbParser._parse_block(block_data)
-            content_blocks.append(parsed_block)
+        content_blocks = [
+            AtrbParser._parse_block(block_data) for block_data in data.get("content", [])
+        ]
 
-        return AtrbDocument(
+        # Blocks are validated above; validate the document fields without
+        # sending every block back through AnyBlock
+        document = AtrbDocument(
             id=data["id"],
             name=data["name"],
             version=data["version"],
-            content=content_blocks,
+            content=[],
         )
+        document.content = content_blocks
+        return document
 
     @staticmethod
     def _parse_block(block_data: dict[str, Any]) -> AnyBlock:
         """Parse a block using Pydantic's discriminated union."""
-        if "children" in block_data and block_data["children"]:
-            parsed_children = [
-                AtrbParser._parse_block(child) for child in block_data["children"]
-            ]
+        # Malformed items (non-dict blocks, non-list children) are left for the
+        # adapter to reject with a ValidationError
+        children = block_data.get("children") if isinstance(block_data, dict) else None
+        if children and isinstance(children, list):
+            parsed_children = [AtrbParser._parse_block(child) for child in children]
             block_data = {**block_data, "children": parsed_children}
 
-        from pydantic import TypeAdapter
-
-        adapter = TypeAdapter(AnyBlock)
-        return adapter.validate_python(block_data)
+        return _BLOCK_ADAPTER.validate_python(block_data)
@@ -169,13 +169,14 @@ class TemplateResolver:
                                 all_variables[var_type] = set()
                             all_variables[var_type].update(refs)
 
-            # Check children recursively
-            if hasattr(block, "children") and block.children:
-                for child in block.children:
-                    extract_from_block(child)
-
-        for block in document.content:
+        # Explicit stack instead of recursion; pushed reversed so blocks are visited
+        # in document order and result keys keep first-seen order
+        stack = list(reversed(document.content))
+        while stack:
+            block = stack.pop()
             extract_from_block(block)
+            if hasattr(block, "children") and block.children:
+                stack.extend(reversed(block.children))
 
         return all_variables
 
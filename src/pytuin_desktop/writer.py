@@ -1,83 +1,191 @@
 # src/pytuin_desktop/writer.py
 from __future__ import annotations
 
+import json
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Literal, TextIO
 import yaml
+from pydantic import TypeAdapter
 
 from pytuin_desktop.models.document import AtrbDocument
-from pytuin_desktop.models.blocks import AnyBlock
 from pytuin_desktop.models.dependency import DependencySpec
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+_DUMP_OPTIONS: dict[str, Any] = {
+    "default_flow_style": False,
+    "allow_unicode": True,
+    "sort_keys": False,
+    "width": 4096,
+}
+_JSON_OPTIONS: dict[str, Any] = {"ensure_ascii": False, "indent": 2}
+# Characters json.dumps leaves raw that YAML 1.1 readers reject or fold into spaces
+_JSON_YAML_UNSAFE = re.compile("[\u007f-\u009f\u2028\u2029\ufeff\ufffe\uffff]")
+# libyaml escapes these (e.g. emoji) as \U even with allow_unicode
+_NON_BMP = re.compile("[\U00010000-\U0010ffff]")
+
+_BLOCK_KEY_ORDER = ("id", "type", "props", "content", "children")
+
+_FORMATS = ("yaml", "json")
+_WRITE_BUFFER_SIZE = 1 << 20
+
+_DOC_ADAPTER = TypeAdapter(AtrbDocument)
+
 
 class AtrbWriter:
     """Writer for serializing AtrbDocument models back to .atrb files."""
 
     @staticmethod
-    def write_file(document: AtrbDocument, filepath: str | Path) -> None:
-        """Write an AtrbDocument to an .atrb file."""
+    def write_file(
+        document: AtrbDocument,
+        filepath: str | Path,
+        output_format: Literal["yaml", "json"] = "yaml",
+    ) -> None:
+        """
+        Write an AtrbDocument to an .atrb file.
+
+        Args:
+            document: Document to write
+            filepath: Destination path
+            output_format: "yaml" (default) or "json". JSON output is escaped to
+                stay valid YAML 1.1, so AtrbParser reads either, but JSON is much
+                cheaper to emit.
+        """
         filepath = Path(filepath)
-        content = AtrbWriter.to_string(document)
+        if output_format not in _FORMATS:
+            raise ValueError(f"Unsupported format: {output_format}")
 
-        with filepath.open("w", encoding="utf-8") as f:
-            f.write(content)
+        data = AtrbWriter._serialize_document(document)
+        # Emit UTF-8 bytes straight into a large binary buffer, skipping TextIOWrapper
+        with filepath.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            AtrbWriter._dump(data, f, output_format, encoding="utf-8")
+
+    @staticmethod
+    def write_stream(
+        document: AtrbDocument,
+        stream: TextIO,
+        output_format: Literal["yaml", "json"] = "yaml",
+    ) -> None:
+        """Write an AtrbDocument directly to a text stream."""
+        if output_format not in _FORMATS:
+            raise ValueError(f"Unsupported format: {output_format}")
+
+        data = AtrbWriter._serialize_document(document)
+        AtrbWriter._dump(data, stream, output_format)
+
+    @staticmethod
+    def _dump(
+        data: dict[str, Any],
+        stream: TextIO | BinaryIO,
+        output_format: Literal["yaml", "json"],
+        encoding: str | None = None,
+    ) -> None:
+        """Dump serialized data to a text stream, or a binary one when encoding is set."""
+        if output_format == "yaml":
+            dumper = AtrbWriter._yaml_dumper(data)
+            yaml.dump(data, stream, Dumper=dumper, encoding=encoding, **_DUMP_OPTIONS)
+        else:
+            # JSON needs its escape pass over the full text, so it is written at once
+            text = AtrbWriter._emit_json(data)
+            stream.write(text.encode(encoding) if encoding else text)
+
+    @staticmethod
+    def _emit_yaml(data: dict[str, Any]) -> str:
+        """Emit YAML text with the dumper chosen by _yaml_dumper."""
+        return yaml.dump(data, Dumper=AtrbWriter._yaml_dumper(data), **_DUMP_OPTIONS)
+
+    @staticmethod
+    def _yaml_dumper(data: dict[str, Any]) -> type:
+        """
+        Pick the YAML dumper before emitting.
+
+        libyaml writes characters outside the BMP as \\U escapes even with
+        allow_unicode, so documents containing any use the pure-Python dumper to
+        keep the text literal. The scan runs in C via json.dumps.
+        """
+        if _YamlDumper is yaml.SafeDumper:
+            return _YamlDumper
+        if _NON_BMP.search(json.dumps(data, ensure_ascii=False)):
+            return yaml.SafeDumper
+        return _YamlDumper
+
+    @staticmethod
+    def _emit_json(data: dict[str, Any]) -> str:
+        """
+        Emit JSON text that PyYAML reads back unchanged.
+
+        JSON is only a subset of YAML 1.2; PyYAML's 1.1 reader rejects C1 controls
+        and treats NEL/LS/PS as line breaks, so those are written as \\u escapes.
+        ensure_ascii is avoided because PyYAML decodes its surrogate pairs as
+        lone surrogates.
+        """
+        text = json.dumps(data, **_JSON_OPTIONS)
+        return _JSON_YAML_UNSAFE.sub(lambda m: f"\\u{ord(m.group()):04x}", text)
 
     @staticmethod
     def to_string(document: AtrbDocument) -> str:
         """Convert an AtrbDocument to YAML string."""
         data = AtrbWriter._serialize_document(document)
-        return yaml.dump(
-            data, default_flow_style=False, allow_unicode=True, sort_keys=False
-        )
+        return AtrbWriter._emit_yaml(data)
+
+    @staticmethod
+    def to_json(document: AtrbDocument) -> str:
+        """Convert an AtrbDocument to a JSON string (skips the YAML emitter)."""
+        data = AtrbWriter._serialize_document(document)
+        return AtrbWriter._emit_json(data)
 
     @staticmethod
     def _serialize_document(document: AtrbDocument) -> dict[str, Any]:
-        """Serialize document to dict with proper field names."""
-        return {
-            "id": str(document.id),
-            "name": document.name,
-            "version": document.version,
-            "content": [
-                AtrbWriter._serialize_block(block) for block in document.content
-            ],
-        }
+        """
+        Serialize document to dict with proper field names.
+
+        The whole tree is dumped once; serialize_as_any keeps nested children
+        typed by their concrete block class rather than BaseBlock.
+        """
+        data = _DOC_ADAPTER.dump_python(
+            document,
+            by_alias=True,
+            exclude_none=True,
+            mode="json",
+            serialize_as_any=True,
+        )
+        AtrbWriter._fixup_blocks(data["content"])
+        return data
 
     @staticmethod
-    def _serialize_block(block: AnyBlock) -> dict[str, Any]:
+    def _fixup_blocks(blocks: list[dict[str, Any]]) -> None:
         """
-        Serialize a block to dict using by_alias for camelCase field names.
-        Handles special serialization for DependencySpec and converts all UUIDs to strings.
+        Post-process already dumped block dicts in place.
+        Converts DependencySpec dicts back to their JSON string form and orders keys.
+        Nested children are walked with an explicit stack instead of recursion.
         """
-        # Use mode='json' to get JSON-serializable types (converts UUID to str automatically)
-        block_dict = block.model_dump(by_alias=True, exclude_none=True, mode="json")
-
-        # Handle DependencySpec serialization in props
-        if "props" in block_dict and isinstance(block_dict["props"], dict):
-            props = block_dict["props"]
-            if "dependency" in props:
-                # If dependency is a dict, convert to DependencySpec and serialize
-                if isinstance(props["dependency"], dict):
+        stack = [blocks]
+        while stack:
+            siblings = stack.pop()
+            for i, block_dict in enumerate(siblings):
+                # Typed props serialize dependency themselves; this covers plain dict props
+                props = block_dict.get("props")
+                if isinstance(props, dict) and isinstance(props.get("dependency"), dict):
                     dep_spec = DependencySpec(**props["dependency"])
                     props["dependency"] = dep_spec.to_json_string()
 
-        # Recursively serialize children (no need to convert UUIDs, mode='json' handles it)
-        if "children" in block_dict and block_dict["children"]:
-            block_dict["children"] = [
-                AtrbWriter._serialize_block(child) for child in block.children
-            ]
-
-        # Reorder keys: id, type, props, content, children (children must be last)
-        ordered = {}
-        for key in ["id", "type", "props", "content", "children"]:
-            if key in block_dict:
-                ordered[key] = block_dict[key]
-
-        # Add any remaining keys (shouldn't happen, but for safety)
-        for key in block_dict:
-            if key not in ordered:
-                print(f"    *** Unexpected key in block serialization: {key}")
-                ordered[key] = block_dict[key]
+                # Reorder keys: id, type, props, content, children (children must be last)
+                ordered = {
+                    key: block_dict[key] for key in _BLOCK_KEY_ORDER if key in block_dict
+                }
 
-        return ordered
+                # Add any remaining keys (shouldn't happen, but for safety)
+                if len(ordered) != len(block_dict):
+                    for key in block_dict:
+                        if key not in ordered:
+                            print(f"    *** Unexpected key in block serialization: {key}")
+                            ordered[key] = block_dict[key]
 
-        # return block_dict
+                siblings[i] = ordered
+                children = ordered.get("children")
+                if children:
+                    stack.append(children)
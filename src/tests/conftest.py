@@ -1,33 +1,66 @@
 # tests/conftest.py
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not available
+    from yaml import SafeLoader as _YamlLoader
 
 from pytuin_desktop.models import AtrbDocument, ParagraphBlock, HeadingBlock
+from pytuin_desktop.parser import AtrbParser
+from pytuin_desktop.writer import AtrbWriter
 from pytuin_desktop.models.content import TextContent
 from pytuin_desktop.models.props import TextProps, HeadingProps
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_atrb_file():
     """Path to the Block_Spec.atrb sample file."""
     return Path(__file__).parent.parent / "Block_Spec.atrb"
 
 
+@pytest.fixture(scope="session")
+def parsed_sample(sample_atrb_file):
+    """Block_Spec.atrb parsed once per session; treat as read-only."""
+    return AtrbParser.parse_file(sample_atrb_file)
+
+
 @pytest.fixture
-def temp_dir():
-    """Temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def sample_document(parsed_sample):
+    """Mutable copy of the parsed Block_Spec.atrb document."""
+    return parsed_sample.model_copy(deep=True)
 
 
 @pytest.fixture
-def simple_document():
-    """Create a simple test document."""
+def temp_dir(tmp_path):
+    """Temporary directory for test files."""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def yaml_load():
+    """YAML loader callable using libyaml when available."""
+    def load(text):
+        return yaml.load(text, Loader=_YamlLoader)
+    return load
+
+
+@pytest.fixture(scope="session")
+def make_document():
+    """Factory wrapping blocks in a minimal validated document."""
+    def make(*blocks, name="Test"):
+        return AtrbDocument(id=uuid4(), name=name, version=1, content=list(blocks))
+    return make
+
+
+def _build_simple_document() -> AtrbDocument:
+    """Build the simple test document with full validation."""
     return AtrbDocument(
         id=uuid4(),
         name="Test Document",
@@ -47,6 +80,18 @@ def simple_document():
     )
 
 
+@pytest.fixture
+def simple_document():
+    """Create a simple test document."""
+    return _build_simple_document()
+
+
+@pytest.fixture(scope="session")
+def simple_document_yaml():
+    """YAML output of the simple document, serialized once per session."""
+    return AtrbWriter.to_string(_build_simple_document())
+
+
 @pytest.fixture
 def sample_yaml():
     """Sample YAML content for testing."""
@@ -39,14 +39,27 @@ from pytuin_desktop.models import (
 class TestBlockBuilder:
     """Test suite for BlockBuilder factory methods."""
 
-    def test_paragraph_basic(self):
-        """Test creating basic paragraph."""
-        block = BlockBuilder.paragraph("Test text")
-
-        assert isinstance(block, ParagraphBlock)
+    @pytest.mark.parametrize(
+        "factory,cls,text",
+        [
+            pytest.param(BlockBuilder.paragraph, ParagraphBlock, "Test text", id="paragraph"),
+            pytest.param(BlockBuilder.quote, QuoteBlock, "Famous quote", id="quote"),
+            pytest.param(
+                BlockBuilder.bullet_list_item, BulletListItemBlock, "Bullet point", id="bullet"
+            ),
+            pytest.param(
+                BlockBuilder.numbered_list_item, NumberedListItemBlock, "First item", id="numbered"
+            ),
+        ],
+    )
+    def test_simple_text_block(self, factory, cls, text):
+        """Test creating single-text blocks."""
+        block = factory(text)
+
+        assert isinstance(block, cls)
         assert isinstance(block.id, UUID)
         assert len(block.content) == 1
-        assert block.content[0].text == "Test text"
+        assert block.content[0].text == text
 
     def test_paragraph_empty(self):
         """Test creating empty paragraph."""
@@ -62,14 +75,14 @@ class TestBlockBuilder:
         assert block.content[0].styles.bold is True
         assert block.content[0].styles.italic is True
 
-    def test_heading_all_levels(self):
+    @pytest.mark.parametrize("level", range(1, 7))
+    def test_heading_all_levels(self, level):
         """Test creating headings at all levels."""
-        for level in range(1, 7):
-            block = BlockBuilder.heading(f"Level {level}", level=level)
+        block = BlockBuilder.heading(f"Level {level}", level=level)
 
-            assert isinstance(block, HeadingBlock)
-            assert block.props.level == level
-            assert block.content[0].text == f"Level {level}"
+        assert isinstance(block, HeadingBlock)
+        assert block.props.level == level
+        assert block.content[0].text == f"Level {level}"
 
     def test_heading_toggleable(self):
         """Test creating toggleable heading."""
@@ -114,27 +127,6 @@ class TestBlockBuilder:
         assert block.props.name == "Test Run"
         assert block.props.type == "bash"
 
-    def test_quote(self):
-        """Test creating quote block."""
-        block = BlockBuilder.quote("Famous quote")
-
-        assert isinstance(block, QuoteBlock)
-        assert block.content[0].text == "Famous quote"
-
-    def test_bullet_list_item(self):
-        """Test creating bullet list item."""
-        block = BlockBuilder.bullet_list_item("Bullet point")
-
-        assert isinstance(block, BulletListItemBlock)
-        assert block.content[0].text == "Bullet point"
-
-    def test_numbered_list_item(self):
-        """Test creating numbered list item."""
-        block = BlockBuilder.numbered_list_item("First item")
-
-        assert isinstance(block, NumberedListItemBlock)
-        assert block.content[0].text == "First item"
-
     def test_checklist_unchecked(self):
         """Test creating unchecked checklist item."""
         block = BlockBuilder.checklist_item("Task")
@@ -216,33 +208,23 @@ class TestBlockBuilder:
 
         assert isinstance(block, LocalDirectoryBlock)
 
-    def test_dropdown_fixed_options(self):
-        """Test creating dropdown with fixed options."""
+    @pytest.mark.parametrize(
+        "options_type,attr,options",
+        [
+            pytest.param("fixed", "fixed_options", "opt1, opt2", id="fixed"),
+            pytest.param("variable", "variable_options", "var1, var2", id="variable"),
+            pytest.param("command", "command_options", "ls -la", id="command"),
+        ],
+    )
+    def test_dropdown_options(self, options_type, attr, options):
+        """Test creating dropdown with each options type."""
         block = BlockBuilder.dropdown(
-            name="Select", options="opt1, opt2", options_type="fixed"
+            name="Select", options=options, options_type=options_type
         )
 
         assert isinstance(block, DropdownBlock)
-        assert block.props.options_type == "fixed"
-        assert block.props.fixed_options == "opt1, opt2"
-
-    def test_dropdown_variable_options(self):
-        """Test creating dropdown with variable options."""
-        block = BlockBuilder.dropdown(
-            name="Select", options="var1, var2", options_type="variable"
-        )
-
-        assert block.props.options_type == "variable"
-        assert block.props.variable_options == "var1, var2"
-
-    def test_dropdown_command_options(self):
-        """Test creating dropdown with command options."""
-        block = BlockBuilder.dropdown(
-            name="Select", options="ls -la", options_type="command"
-        )
-
-        assert block.props.options_type == "command"
-        assert block.props.command_options == "ls -la"
+        assert block.props.options_type == options_type
+        assert getattr(block.props, attr) == options
 
     def test_sqlite(self):
         """Test creating SQLite block."""
@@ -259,22 +241,23 @@ class TestBlockBuilder:
         assert isinstance(block, PostgresBlock)
         assert block.props.uri == "postgresql://localhost"
 
-    def test_http_get(self):
-        """Test creating HTTP GET block."""
-        block = BlockBuilder.http(name="API", url="https://api.example.com", verb="GET")
-
-        assert isinstance(block, HttpBlock)
-        assert block.props.verb == "GET"
-        assert block.props.url == "https://api.example.com"
-
-    def test_http_post(self):
-        """Test creating HTTP POST block."""
+    @pytest.mark.parametrize(
+        "verb,body",
+        [
+            pytest.param("GET", "", id="GET"),
+            pytest.param("POST", '{"key": "value"}', id="POST"),
+        ],
+    )
+    def test_http(self, verb, body):
+        """Test creating HTTP block for each verb."""
         block = BlockBuilder.http(
-            name="API", url="https://api.example.com", verb="POST", body='{"key": "value"}'
+            name="API", url="https://api.example.com", verb=verb, body=body
         )
 
-        assert block.props.verb == "POST"
-        assert block.props.body == '{"key": "value"}'
+        assert isinstance(block, HttpBlock)
+        assert block.props.verb == verb
+        assert block.props.url == "https://api.example.com"
+        assert block.props.body == body
 
     def test_image(self):
         """Test creating image block."""
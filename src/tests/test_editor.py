@@ -7,7 +7,7 @@ import pytest
 
 from pytuin_desktop.editor import DocumentEditor
 from pytuin_desktop.builders import BlockBuilder
-from pytuin_desktop.models import AtrbDocument, HeadingBlock, ParagraphBlock
+from pytuin_desktop.models import AtrbDocument, HeadingBlock
 from pytuin_desktop.parser import AtrbParser
 
 
@@ -57,6 +57,18 @@ class TestDocumentEditor:
         assert isinstance(editor.get_block(1), HeadingBlock)
         assert editor.get_block(1).content[0].text == "Inserted"
 
+    def test_extend_blocks(self, simple_document):
+        """Test appending several blocks at once."""
+        editor = DocumentEditor(simple_document)
+        original_len = len(editor)
+        new_blocks = [BlockBuilder.paragraph(f"Item {i}") for i in range(3)]
+
+        editor.extend_blocks(iter(new_blocks))
+
+        assert len(editor) == original_len + 3
+        assert editor.get_block(-1) is new_blocks[-1]
+        assert editor.find_block(str(new_blocks[0].id)) == (original_len, new_blocks[0])
+
     def test_remove_block_by_id(self, simple_document):
         """Test removing block by UUID."""
         editor = DocumentEditor(simple_document)
@@ -83,6 +95,28 @@ class TestDocumentEditor:
 
         assert len(editor) == original_len - 1
 
+    def test_truncate(self, simple_document):
+        """Test truncating document to a prefix of blocks."""
+        editor = DocumentEditor(simple_document)
+        kept = editor.get_block(0)
+        dropped = editor.get_block(1)
+
+        editor.truncate(1)
+
+        assert len(editor) == 1
+        assert editor.find_block(str(kept.id)) == (0, kept)
+        assert editor.find_block(str(dropped.id)) is None
+
+    def test_truncate_negative_length_raises(self, simple_document):
+        """Test negative lengths are rejected instead of clearing the document."""
+        editor = DocumentEditor(simple_document)
+        original_len = len(editor)
+
+        with pytest.raises(ValueError, match="negative"):
+            editor.truncate(-1)
+
+        assert len(editor) == original_len
+
     def test_move_block_forward(self, simple_document):
         """Test moving block forward in document."""
         editor = DocumentEditor(simple_document)
@@ -101,6 +135,16 @@ class TestDocumentEditor:
 
         assert editor.get_block(0).id == block.id
 
+    def test_move_and_swap_same_index_noop(self, simple_document):
+        """Test moving or swapping a block onto itself changes nothing."""
+        editor = DocumentEditor(simple_document)
+        order = [b.id for b in editor]
+
+        editor.move_block(1, 1).swap_blocks(0, 0)
+
+        assert [b.id for b in editor] == order
+        assert editor.find_block(str(order[1]))[0] == 1
+
     def test_swap_blocks(self, simple_document):
         """Test swapping two blocks."""
         editor = DocumentEditor(simple_document)
@@ -131,6 +175,21 @@ class TestDocumentEditor:
         assert result[0] == 0
         assert result[1].id == editor.get_block(0).id
 
+    def test_find_block_after_edits(self, simple_document):
+        """Test lookups reflect inserts, appends and moves."""
+        editor = DocumentEditor(simple_document)
+        first = editor.get_block(0)
+        inserted = BlockBuilder.paragraph("Inserted")
+        appended = BlockBuilder.paragraph("Appended")
+
+        editor.add_block(inserted, index=0).add_block(appended)
+        assert editor.find_block(str(first.id)) == (1, first)
+        assert editor.find_block(str(appended.id)) == (len(editor) - 1, appended)
+
+        editor.move_block(0, len(editor) - 1)
+        assert editor.find_block(str(inserted.id)) == (len(editor) - 1, inserted)
+        assert editor.find_block(str(first.id)) == (0, first)
+
     def test_find_block_not_found(self, simple_document):
         """Test finding non-existent block returns None."""
         editor = DocumentEditor(simple_document)
@@ -174,11 +233,32 @@ class TestDocumentEditor:
         assert len(blocks) == len(simple_document.content)
         assert all(hasattr(b, "type") for b in blocks)
 
+    def test_walk_blocks_nested_order_and_depth(self):
+        """Test walk_blocks yields depth-first with nesting depth."""
+        inner = BlockBuilder.toggle_item("Inner", children=[BlockBuilder.paragraph("Deep")])
+        outer = BlockBuilder.toggle_item(
+            "Outer", children=[inner, BlockBuilder.paragraph("Sibling")]
+        )
+        editor = DocumentEditor.create("Walk")
+        editor.add_block(outer).add_block(BlockBuilder.paragraph("Last"))
+
+        walked = [(b.content[0].text, depth) for b, depth in editor.walk_blocks()]
+
+        assert walked == [
+            ("Outer", None),
+            ("Inner", 0),
+            ("Deep", 1),
+            ("Sibling", 0),
+            ("Last", None),
+        ]
+        assert len(editor.flatten_blocks()) == 5
+        assert [b for b, _ in editor.walk_blocks(include_nested=False)] == [
+            outer,
+            editor.get_block(1),
+        ]
+
     def test_chaining_operations(self):
         """Test method chaining."""
-        from pytuin_desktop.models import AtrbDocument
-        from uuid import uuid4
-
         doc = AtrbDocument(
             id=uuid4(),
             name="Test",
@@ -197,10 +277,10 @@ class TestDocumentEditor:
 
         assert len(editor) == original_len + 2
 
-    def test_complex_editing_workflow(self, sample_atrb_file, temp_dir):
+    def test_complex_editing_workflow(self, sample_document, temp_dir):
         """Test complex editing workflow."""
         # Load, edit, save, reload
-        editor = DocumentEditor.from_file(sample_atrb_file)
+        editor = DocumentEditor(sample_document)
         original_count = len(editor)
 
         # Add new section
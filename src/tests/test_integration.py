@@ -9,32 +9,20 @@ from pytuin_desktop import AtrbParser, AtrbWriter, DocumentEditor, BlockBuilder
 class TestRoundTrip:
     """Test round-trip operations: parse -> edit -> write -> parse."""
 
-    def test_parse_write_parse_preserves_data(self, sample_atrb_file, temp_dir):
+    def test_parse_write_parse_preserves_data(self, parsed_sample):
         """Test parsing, writing, and re-parsing preserves all data."""
-        # Parse original
-        original = AtrbParser.parse_file(sample_atrb_file)
+        original = parsed_sample
 
-        # Write to new file
-        output = temp_dir / "roundtrip.atrb"
-        AtrbWriter.write_file(original, output)
+        # Serialize and re-parse in memory
+        reloaded = AtrbParser.parse_string(AtrbWriter.to_string(original))
 
-        # Re-parse
-        reloaded = AtrbParser.parse_file(output)
-
-        # Verify
-        assert reloaded.name == original.name
-        assert reloaded.version == original.version
-        assert len(reloaded.content) == len(original.content)
+        # Model equality compares nested children by their concrete block types
+        assert reloaded == original
 
-        # Check first few blocks match
-        for i in range(min(5, len(original.content))):
-            assert reloaded.content[i].type == original.content[i].type
-            assert str(reloaded.content[i].id) == str(original.content[i].id)
-
-    def test_edit_write_parse_roundtrip(self, sample_atrb_file, temp_dir):
+    def test_edit_write_parse_roundtrip(self, sample_document, temp_dir):
         """Test editing, writing, and re-parsing works correctly."""
         # Load and edit
-        editor = DocumentEditor.from_file(sample_atrb_file)
+        editor = DocumentEditor(sample_document)
         original_count = len(editor)
 
         editor.add_block(BlockBuilder.heading("Added Section", level=2))
@@ -47,8 +35,7 @@ class TestRoundTrip:
         # Reload and verify
         reloaded = AtrbParser.parse_file(output)
         assert len(reloaded.content) == original_count + 2
-        assert reloaded.content[-2].type == "heading"
-        assert reloaded.content[-1].type == "paragraph"
+        assert [b.type for b in reloaded.content[-2:]] == ["heading", "paragraph"]
 
     def test_create_write_parse_roundtrip(self, temp_dir):
         """Test creating, writing, and parsing new document."""
@@ -67,9 +54,12 @@ class TestRoundTrip:
         reloaded = AtrbParser.parse_file(output)
 
         assert reloaded.name == "Test Doc"
-        assert len(reloaded.content) == 4
-        assert reloaded.content[0].type == "heading"
-        assert reloaded.content[2].type == "bulletListItem"
+        assert [b.type for b in reloaded.content] == [
+            "heading",
+            "paragraph",
+            "bulletListItem",
+            "bulletListItem",
+        ]
 
 
 class TestWorkflows:
@@ -95,12 +85,18 @@ class TestWorkflows:
         assert output.exists()
         doc = AtrbParser.parse_file(output)
         assert doc.name == "Project README"
-        assert len(doc.content) == 5
-
-    def test_modify_existing_document_workflow(self, sample_atrb_file, temp_dir):
+        assert [b.type for b in doc.content] == [
+            "heading",
+            "paragraph",
+            "horizontal_rule",
+            "heading",
+            "codeBlock",
+        ]
+
+    def test_modify_existing_document_workflow(self, sample_document, temp_dir):
         """Test workflow for modifying existing document."""
         # Load
-        editor = DocumentEditor.from_file(sample_atrb_file)
+        editor = DocumentEditor(sample_document)
 
         # Insert new section at beginning
         editor.add_block(BlockBuilder.heading("Overview", level=1), index=0)
@@ -115,30 +111,29 @@ class TestWorkflows:
 
         # Verify
         doc = AtrbParser.parse_file(output)
-        assert doc.content[0].type == "heading"
-        assert doc.content[1].type == "paragraph"
+        assert [b.type for b in doc.content[:2]] == ["heading", "paragraph"]
 
-    # def test_template_based_workflow(self, sample_atrb_file, temp_dir):
-    #     """Test workflow using template."""
-    #     # Create from template
-    #     editor = DocumentEditor.from_template(sample_atrb_file, "My Project")
+    def test_template_based_workflow(self, sample_atrb_file, temp_dir):
+        """Test workflow using template."""
+        # Create from template
+        editor = DocumentEditor.from_template(sample_atrb_file, "My Project")
 
-    #     # Clear most content
-    #     while len(editor) > 5:
-    #         editor.remove_block_at(-1)
+        # Clear most content
+        editor.truncate(5)
 
-    #     # Add custom content
-    #     editor.add_block(BlockBuilder.heading("Custom Section", level=2))
-    #     editor.add_block(BlockBuilder.paragraph("Custom content here."))
+        # Add custom content
+        editor.add_block(BlockBuilder.heading("Custom Section", level=2))
+        editor.add_block(BlockBuilder.paragraph("Custom content here."))
 
-    #     # Save
-    #     output = temp_dir / "project.atrb"
-    #     editor.save(output)
+        # Save
+        output = temp_dir / "project.atrb"
+        editor.save(output)
 
-    #     # Verify
-    #     doc = AtrbParser.parse_file(output)
-    #     assert doc.name == "My Project"
-    #     assert doc.content[-2].type == "heading"
+        # Verify
+        doc = AtrbParser.parse_file(output)
+        assert doc.name == "My Project"
+        assert len(doc.content) == 7
+        assert doc.content[-2].type == "heading"
 
     def test_complex_nested_structure_workflow(self, temp_dir):
         """Test creating complex nested structures."""
@@ -193,27 +188,22 @@ class TestWorkflows:
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_empty_document_roundtrip(self, temp_dir):
+    def test_empty_document_roundtrip(self):
         """Test empty document can be written and read."""
         editor = DocumentEditor.create("Empty")
-        output = temp_dir / "empty.atrb"
 
-        editor.save(output)
-        doc = AtrbParser.parse_file(output)
+        doc = AtrbParser.parse_string(editor.to_string())
 
         assert doc.name == "Empty"
         assert len(doc.content) == 0
 
-    def test_document_with_only_empty_blocks(self, temp_dir):
+    def test_document_with_only_empty_blocks(self):
         """Test document with empty paragraphs."""
         editor = DocumentEditor.create("Empty Blocks")
         editor.add_block(BlockBuilder.paragraph())
         editor.add_block(BlockBuilder.paragraph())
 
-        output = temp_dir / "empty_blocks.atrb"
-        editor.save(output)
-
-        doc = AtrbParser.parse_file(output)
+        doc = AtrbParser.parse_string(editor.to_string())
         assert len(doc.content) == 2
         assert all(len(b.content) == 0 for b in doc.content)
 
@@ -230,21 +220,27 @@ class TestEdgeCases:
         assert "世界" in doc.content[0].content[0].text
         assert "😀" in doc.content[1].content[0].text
 
-    def test_large_document_roundtrip(self, temp_dir):
+    @pytest.mark.parametrize(
+        "count",
+        [
+            pytest.param(5, id="smoke"),
+            pytest.param(100, id="scale", marks=pytest.mark.slow),
+        ],
+    )
+    def test_large_document_roundtrip(self, temp_dir, count):
         """Test handling large documents."""
         editor = DocumentEditor.create("Large Doc")
 
         # Add many blocks
-        for i in range(100):
-            editor.add_block(BlockBuilder.paragraph(f"Paragraph {i}"))
+        editor.extend_blocks(BlockBuilder.paragraph(f"Paragraph {i}") for i in range(count))
 
         output = temp_dir / "large.atrb"
         editor.save(output)
 
         doc = AtrbParser.parse_file(output)
-        assert len(doc.content) == 100
+        assert len(doc.content) == count
 
-    def test_deeply_nested_toggles(self, temp_dir):
+    def test_deeply_nested_toggles(self):
         """Test deeply nested toggle structures."""
         level3 = BlockBuilder.toggle_item(
             "Level 3", children=[BlockBuilder.paragraph("Deep content")]
@@ -255,14 +251,11 @@ class TestEdgeCases:
         editor = DocumentEditor.create("Nested")
         editor.add_block(level1)
 
-        output = temp_dir / "nested.atrb"
-        editor.save(output)
-
-        doc = AtrbParser.parse_file(output)
+        doc = AtrbParser.parse_string(editor.to_string())
         assert len(doc.content[0].children) == 1
         assert len(doc.content[0].children[0].children) == 1
 
-    def test_special_characters_in_code(self, temp_dir):
+    def test_special_characters_in_code(self):
         """Test special characters in code blocks."""
         code = '''def test():
     return "<>&\'"'''
@@ -270,8 +263,5 @@ class TestEdgeCases:
         editor = DocumentEditor.create("Code")
         editor.add_block(BlockBuilder.code_block(code, language="python"))
 
-        output = temp_dir / "code.atrb"
-        editor.save(output)
-
-        doc = AtrbParser.parse_file(output)
+        doc = AtrbParser.parse_string(editor.to_string())
         assert "<>&" in doc.content[0].content[0].text
@@ -14,6 +14,7 @@ from pytuin_desktop.models import (
     ScriptBlock,
 )
 from pytuin_desktop.models.content import TextContent, TextStyles
+from pytuin_desktop.models.dependency import DependencySpec
 from pytuin_desktop.models.props import HeadingProps, TextProps, EditorProps, ScriptProps
 
 
@@ -40,13 +41,11 @@ class TestBaseBlockValidation:
 class TestHeadingBlockValidation:
     """Test HeadingBlock validation."""
 
-    def test_valid_heading_levels(self):
+    @pytest.mark.parametrize("level", range(1, 7))
+    def test_valid_heading_levels(self, level):
         """Test valid heading levels 1-6."""
-        for level in range(1, 7):
-            block = HeadingBlock(
-                id=uuid4(), props=HeadingProps(level=level), content=[]
-            )
-            assert block.props.level == level
+        block = HeadingBlock(id=uuid4(), props=HeadingProps(level=level), content=[])
+        assert block.props.level == level
 
     def test_invalid_heading_level_high(self):
         """Test heading level > 6 is invalid."""
@@ -182,6 +181,36 @@ class TestScriptBlockValidation:
         assert block.props.dependency == "{}"
 
 
+class TestDependencySpec:
+    """Test DependencySpec JSON string storage."""
+
+    def test_to_json_string_empty(self):
+        """Test empty dependency serializes to '{}'."""
+        assert DependencySpec().to_json_string() == "{}"
+
+    def test_to_json_string_tracks_mutation(self):
+        """Test cached JSON reflects later mutations."""
+        spec = DependencySpec()
+        assert spec.to_json_string() == "{}"
+
+        spec.add_block_dependency("block-1")
+        spec.variables.append("var")
+
+        assert spec.to_json_string() == '{"blocks": ["block-1"], "variables": ["var"]}'
+
+    def test_json_dump_stores_string(self):
+        """Test props dump dependency as a JSON string in json mode only."""
+        props = ScriptProps(
+            name="Script",
+            code="",
+            interpreter="/bin/bash",
+            dependency='{"blocks": ["b"]}',
+        )
+
+        assert props.model_dump(mode="json")["dependency"] == '{"blocks": ["b"]}'
+        assert props.model_dump()["dependency"] == {"blocks": ["b"], "variables": []}
+
+
 class TestDocumentValidation:
     """Test AtrbDocument validation."""
 
@@ -233,8 +262,6 @@ class TestDiscriminatedUnion:
 
     def test_invalid_block_type_rejected(self):
         """Test invalid block type is rejected by parser."""
-        from pytuin_desktop.models.blocks import AnyBlock
-
         # This should work with valid type
         valid_block = HeadingBlock(
             id=uuid4(), props=HeadingProps(level=1), content=[]
@@ -1,17 +1,17 @@
 # tests/test_parser.py
 from __future__ import annotations
 
-from pathlib import Path
+import io
 from uuid import UUID
 
 import pytest
+from pydantic import ValidationError
 
-from pytuin_desktop.parser import AtrbParser
+from pytuin_desktop.parser import AtrbParser, clear_parse_cache
 from pytuin_desktop.models import (
     HeadingBlock,
     ParagraphBlock,
     EditorBlock,
-    ScriptBlock,
     ToggleListItemBlock,
 )
 
@@ -37,6 +37,37 @@ class TestAtrbParser:
         assert len(doc.content) == 1
         assert doc.content[0].type == "heading"
 
+    def test_parse_stream(self, sample_yaml):
+        """Test parsing from a text stream matches parsing the string."""
+        doc = AtrbParser.parse_stream(io.StringIO(sample_yaml))
+
+        assert doc == AtrbParser.parse_string(sample_yaml)
+
+    def test_parse_unknown_block_type_rejected(self, sample_yaml):
+        """Test blocks with an unknown type tag fail validation."""
+        with pytest.raises(ValidationError):
+            AtrbParser.parse_string(sample_yaml.replace("type: heading", "type: bogus"))
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ("type: heading", "type: [a, b]"),
+            ("type: heading", "type: {x: 1}"),
+            ("- id: f6596d68", "- not a block\n- id: f6596d68"),
+        ],
+        ids=["list-tag", "dict-tag", "bare-string"],
+    )
+    def test_parse_malformed_block_rejected(self, sample_yaml, old, new):
+        """Test malformed block items fail validation rather than crashing."""
+        with pytest.raises(ValidationError):
+            AtrbParser.parse_string(sample_yaml.replace(old, new, 1))
+
+    def test_parse_block_without_type_defaults_to_paragraph(self, sample_yaml):
+        """Test blocks missing a type tag parse as paragraphs."""
+        doc = AtrbParser.parse_string(sample_yaml.replace("  type: heading\n", ""))
+
+        assert isinstance(doc.content[0], ParagraphBlock)
+
     def test_parse_invalid_file(self, temp_dir):
         """Test parsing invalid file raises appropriate error."""
         invalid_file = temp_dir / "invalid.atrb"
@@ -50,9 +81,44 @@ class TestAtrbParser:
         with pytest.raises(FileNotFoundError):
             AtrbParser.parse_file("/nonexistent/file.atrb")
 
-    def test_block_types_parsed_correctly(self, sample_atrb_file):
+    def test_parse_file_cached_returns_independent_copies(self, sample_atrb_file):
+        """Test repeated parses are equal but safe to mutate separately."""
+        first = AtrbParser.parse_file(sample_atrb_file)
+        second = AtrbParser.parse_file(sample_atrb_file)
+
+        assert first == second
+        first.content.clear()
+        assert len(second.content) > 0
+        assert len(AtrbParser.parse_file(sample_atrb_file).content) > 0
+
+    def test_parse_file_cache_not_shared_through_props(self, sample_yaml, temp_dir):
+        """Test mutating nested untyped props does not leak into later parses."""
+        path = temp_dir / "rule.atrb"
+        path.write_text(
+            sample_yaml.split("content:\n", 1)[0]
+            + "content:\n- id: f6596d68-4414-48f3-b502-eb54c9a00b17\n"
+            + "  type: horizontal_rule\n  props: {tags: [a]}\n  children: []\n"
+        )
+
+        AtrbParser.parse_file(path).content[0].props["tags"].append("b")
+
+        assert AtrbParser.parse_file(path).content[0].props["tags"] == ["a"]
+
+    def test_parse_file_cache_sees_file_changes(self, sample_yaml, temp_dir):
+        """Test rewriting a file invalidates its cached parse."""
+        path = temp_dir / "changing.atrb"
+        path.write_text(sample_yaml)
+        assert AtrbParser.parse_file(path).name == "Test"
+
+        path.write_text(sample_yaml.replace("name: Test", "name: Changed"))
+        assert AtrbParser.parse_file(path).name == "Changed"
+
+        clear_parse_cache()
+        assert AtrbParser.parse_file(path).name == "Changed"
+
+    def test_block_types_parsed_correctly(self, parsed_sample):
         """Test different block types are parsed with correct types."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         block_types = {block.type for block in doc.content}
 
@@ -66,9 +132,9 @@ class TestAtrbParser:
         }
         assert expected_types.issubset(block_types)
 
-    def test_heading_block_properties(self, sample_atrb_file):
+    def test_heading_block_properties(self, parsed_sample):
         """Test heading block parsed with correct properties."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         headings = [b for b in doc.content if isinstance(b, HeadingBlock)]
         assert len(headings) > 0
@@ -78,9 +144,9 @@ class TestAtrbParser:
         assert 1 <= heading.props.level <= 6
         assert hasattr(heading.props, "is_toggleable")
 
-    def test_editor_block_properties(self, sample_atrb_file):
+    def test_editor_block_properties(self, parsed_sample):
         """Test editor block parsed with correct properties."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         editors = [b for b in doc.content if isinstance(b, EditorBlock)]
         assert len(editors) > 0
@@ -90,9 +156,9 @@ class TestAtrbParser:
         assert hasattr(editor.props, "code")
         assert hasattr(editor.props, "language")
 
-    def test_nested_blocks_parsed(self, sample_atrb_file):
+    def test_nested_blocks_parsed(self, parsed_sample):
         """Test nested blocks (toggles with children) parsed correctly."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         toggles = [b for b in doc.content if isinstance(b, ToggleListItemBlock)]
         assert len(toggles) > 0
@@ -102,9 +168,9 @@ class TestAtrbParser:
         assert toggle_with_children is not None
         assert len(toggle_with_children.children) > 0
 
-    def test_empty_content_arrays(self, sample_atrb_file):
+    def test_empty_content_arrays(self, parsed_sample):
         """Test blocks with empty content arrays are parsed correctly."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         # Empty paragraphs exist in the spec
         empty_paragraphs = [
@@ -112,17 +178,17 @@ class TestAtrbParser:
         ]
         assert len(empty_paragraphs) > 0
 
-    def test_uuid_format(self, sample_atrb_file):
+    def test_uuid_format(self, parsed_sample):
         """Test UUIDs are parsed correctly."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         assert isinstance(doc.id, UUID)
         for block in doc.content:
             assert isinstance(block.id, UUID)
 
-    def test_text_content_with_styles(self, sample_atrb_file):
+    def test_text_content_with_styles(self, parsed_sample):
         """Test text content and styles are parsed."""
-        doc = AtrbParser.parse_file(sample_atrb_file)
+        doc = parsed_sample
 
         paragraphs = [
             b for b in doc.content if isinstance(b, ParagraphBlock) and len(b.content) > 0
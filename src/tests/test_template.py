@@ -0,0 +1,28 @@
+# tests/test_template.py
+from __future__ import annotations
+
+from pytuin_desktop.builders import BlockBuilder
+from pytuin_desktop.template import TemplateResolver
+
+
+class TestTemplateResolver:
+    """Test suite for TemplateResolver."""
+
+    def test_find_document_variables_in_document_order(self, make_document):
+        """Test variables are collected depth-first in document order."""
+        doc = make_document(
+            BlockBuilder.paragraph("{{ doc.first }}"),
+            BlockBuilder.toggle_item(
+                "Toggle", children=[BlockBuilder.paragraph("{{ workspace.root }}")]
+            ),
+            BlockBuilder.paragraph("{{ var.name }} and {{ doc.last }}"),
+        )
+
+        found = TemplateResolver().find_document_variables(doc)
+
+        assert list(found) == ["doc", "workspace", "var"]
+        assert found == {
+            "doc": {"first", "last"},
+            "workspace": {"root"},
+            "var": {"name"},
+        }
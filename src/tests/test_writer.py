@@ -1,20 +1,23 @@
 # tests/test_writer.py
 from __future__ import annotations
 
+import io
+import json
 from uuid import uuid4
 
 import pytest
 import yaml
 
 from pytuin_desktop.writer import AtrbWriter
+from pytuin_desktop.builders import BlockBuilder
 from pytuin_desktop.models import (
-    AtrbDocument,
-    HeadingBlock,
     ParagraphBlock,
     HorizontalRuleBlock,
+    ScriptBlock,
+    ToggleListItemBlock,
 )
-from pytuin_desktop.models.content import TextContent
-from pytuin_desktop.models.props import HeadingProps, TextProps
+from pytuin_desktop.models.content import TextContent, TextStyles
+from pytuin_desktop.models.props import ScriptProps, TextProps
 from pytuin_desktop.parser import AtrbParser
 
 
@@ -30,188 +33,258 @@ class TestAtrbWriter:
         assert output_file.exists()
         assert output_file.stat().st_size > 0
 
-    def test_to_string_generates_yaml(self, simple_document):
+    def test_write_stream_matches_to_string(self, simple_document):
+        """Test streaming to a text handle produces the same YAML as to_string."""
+        buffer = io.StringIO()
+
+        AtrbWriter.write_stream(simple_document, buffer)
+
+        assert buffer.getvalue() == AtrbWriter.to_string(simple_document)
+
+    def test_write_file_json_format(self, simple_document, temp_dir):
+        """Test JSON output is readable by the YAML parser."""
+        output_file = temp_dir / "test.atrb"
+
+        AtrbWriter.write_file(simple_document, output_file, output_format="json")
+
+        assert output_file.read_text(encoding="utf-8").startswith("{")
+        reloaded = AtrbParser.parse_file(output_file)
+        assert reloaded.name == simple_document.name
+        assert reloaded.content[0].id == simple_document.content[0].id
+
+    def test_json_roundtrips_yaml_unsafe_characters(self, make_document, temp_dir):
+        """Test C1 controls and Unicode line breaks survive the JSON path."""
+        text = "a\x80b\x85c\u2028d\u2029e\ufefff\x7f"
+        doc = make_document(BlockBuilder.paragraph(text))
+        output_file = temp_dir / "unsafe.atrb"
+
+        AtrbWriter.write_file(doc, output_file, output_format="json")
+
+        assert AtrbParser.parse_file(output_file).content[0].content[0].text == text
+        assert AtrbParser.parse_string(AtrbWriter.to_json(doc)) == doc
+        assert json.loads(AtrbWriter.to_json(doc))["content"][0]["content"][0]["text"] == text
+
+    def test_write_file_matches_to_string(self, simple_document, temp_dir):
+        """Test the binary file path writes the same UTF-8 YAML as to_string."""
+        output_file = temp_dir / "test.atrb"
+
+        AtrbWriter.write_file(simple_document, output_file)
+
+        expected = AtrbWriter.to_string(simple_document).encode("utf-8")
+        assert output_file.read_bytes() == expected
+
+    def test_write_file_rejects_unknown_format(self, simple_document, temp_dir):
+        """Test unknown formats fail before the target file is created."""
+        output_file = temp_dir / "test.atrb"
+
+        with pytest.raises(ValueError, match="Unsupported format"):
+            AtrbWriter.write_file(simple_document, output_file, output_format="toml")
+
+        assert not output_file.exists()
+
+    def test_write_stream_rejects_unknown_format(self, simple_document):
+        """Test unknown output formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            AtrbWriter.write_stream(simple_document, io.StringIO(), output_format="toml")
+
+    def test_to_string_generates_yaml(self, simple_document_yaml, yaml_load):
         """Test to_string generates valid YAML."""
-        yaml_str = AtrbWriter.to_string(simple_document)
+        yaml_str = simple_document_yaml
 
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
         assert parsed["name"] == "Test Document"
         assert parsed["version"] == 1
         assert "content" in parsed
 
-    def test_uuid_serialization(self, simple_document):
+    def test_uuid_serialization(self, simple_document_yaml, yaml_load):
         """Test UUIDs serialize as strings, not objects."""
-        yaml_str = AtrbWriter.to_string(simple_document)
+        yaml_str = simple_document_yaml
 
         # Should not contain Python object markers
         assert "!!python/object:uuid.UUID" not in yaml_str
 
         # Should contain valid UUID strings
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
         assert isinstance(parsed["id"], str)
         assert isinstance(parsed["content"][0]["id"], str)
 
-    def test_camel_case_field_names(self, simple_document):
+    def test_camel_case_field_names(self, simple_document_yaml, yaml_load):
         """Test field names are camelCase in output."""
-        yaml_str = AtrbWriter.to_string(simple_document)
-        parsed = yaml.safe_load(yaml_str)
+        yaml_str = simple_document_yaml
+        parsed = yaml_load(yaml_str)
 
         block = parsed["content"][0]
         assert "textColor" in block["props"]
         assert "backgroundColor" in block["props"]
         assert "text_color" not in block["props"]
 
-    def test_empty_arrays_preserved(self):
+    def test_to_json_matches_yaml_data(self, simple_document, yaml_load):
+        """Test to_json serializes the same data as to_string."""
+        json_str = AtrbWriter.to_json(simple_document)
+
+        assert json.loads(json_str) == yaml_load(AtrbWriter.to_string(simple_document))
+        assert AtrbParser.parse_string(json_str) == simple_document
+
+    def test_empty_arrays_preserved(self, make_document, yaml_load):
         """Test empty content/children arrays are preserved."""
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[
-                ParagraphBlock(
-                    id=uuid4(),
-                    props=TextProps(),
-                    content=[],
-                )
-            ],
+        doc = make_document(
+            ParagraphBlock(
+                id=uuid4(),
+                props=TextProps(),
+                content=[],
+            )
         )
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         assert parsed["content"][0]["content"] == []
         assert parsed["content"][0]["children"] == []
 
-    def test_nested_blocks_serialization(self):
+    def test_nested_blocks_serialization(self, make_document, yaml_load):
         """Test nested blocks (children) serialize correctly."""
-        from pytuin_desktop.models import ToggleListItemBlock
-
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[
-                ToggleListItemBlock(
-                    id=uuid4(),
-                    props=TextProps(),
-                    content=[TextContent(text="Toggle")],
-                    children=[
-                        ParagraphBlock(
-                            id=uuid4(),
-                            props=TextProps(),
-                            content=[TextContent(text="Nested")],
-                        )
-                    ],
-                )
-            ],
+        doc = make_document(
+            ToggleListItemBlock(
+                id=uuid4(),
+                props=TextProps(),
+                content=[TextContent(text="Toggle")],
+                children=[
+                    ParagraphBlock(
+                        id=uuid4(),
+                        props=TextProps(),
+                        content=[TextContent(text="Nested")],
+                    )
+                ],
+            )
         )
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         assert len(parsed["content"][0]["children"]) == 1
         assert parsed["content"][0]["children"][0]["type"] == "paragraph"
+        assert parsed["content"][0]["children"][0]["content"][0]["text"] == "Nested"
 
-    def test_horizontal_rule_props(self):
+    def test_horizontal_rule_props(self, make_document, yaml_load):
         """Test HorizontalRuleBlock with empty props dict."""
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[HorizontalRuleBlock(id=uuid4())],
-        )
+        doc = make_document(HorizontalRuleBlock(id=uuid4()))
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         # Props should be empty dict
         assert parsed["content"][0]["props"] == {}
 
-    def test_text_styles_serialization(self):
+    def test_text_styles_serialization(self, make_document, yaml_load):
         """Test text styles serialize with all boolean fields."""
-        from pytuin_desktop.models.content import TextStyles
-
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[
-                ParagraphBlock(
-                    id=uuid4(),
-                    props=TextProps(),
-                    content=[
-                        TextContent(
-                            text="Bold text",
-                            styles=TextStyles(bold=True, italic=False),
-                        )
-                    ],
-                )
-            ],
+        doc = make_document(
+            ParagraphBlock(
+                id=uuid4(),
+                props=TextProps(),
+                content=[
+                    TextContent(
+                        text="Bold text",
+                        styles=TextStyles(bold=True, italic=False),
+                    )
+                ],
+            )
         )
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         styles = parsed["content"][0]["content"][0]["styles"]
         assert styles["bold"] is True
         assert styles["italic"] is False
 
-    def test_special_characters_preserved(self):
+    def test_special_characters_preserved(self, make_document, yaml_load):
         """Test special characters in text are preserved."""
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[
-                ParagraphBlock(
-                    id=uuid4(),
-                    props=TextProps(),
-                    content=[TextContent(text="😀 Special: <>&'\"")],
-                )
-            ],
+        doc = make_document(
+            ParagraphBlock(
+                id=uuid4(),
+                props=TextProps(),
+                content=[TextContent(text="😀 Special: <>&'\"")],
+            )
         )
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         assert parsed["content"][0]["content"][0]["text"] == "😀 Special: <>&'\""
 
-    def test_roundtrip_preserves_data(self, simple_document, temp_dir):
+    def test_non_bmp_characters_written_literally(self, make_document, temp_dir):
+        """Test emoji are written as-is rather than as \\U escapes."""
+        doc = make_document(BlockBuilder.paragraph("Smile 😀"))
+        output_file = temp_dir / "emoji.atrb"
+
+        AtrbWriter.write_file(doc, output_file)
+
+        assert "text: Smile 😀\n" in AtrbWriter.to_string(doc)
+        assert "\\U" not in output_file.read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize(
+        "text", ["Smile 😀", "cd C:\\Users\\me"], ids=["emoji", "backslash-u"]
+    )
+    def test_yaml_emitted_once(self, make_document, monkeypatch, text):
+        """Test each document goes through the YAML emitter exactly once."""
+        calls = []
+        dump = yaml.dump
+
+        def counting_dump(*args, **kwargs):
+            calls.append(1)
+            return dump(*args, **kwargs)
+
+        monkeypatch.setattr(yaml, "dump", counting_dump)
+        doc = make_document(BlockBuilder.paragraph(text))
+
+        output = AtrbWriter.to_string(doc)
+
+        assert len(calls) == 1
+        assert f"text: {text}\n" in output
+
+    def test_roundtrip_preserves_data(self, simple_document):
         """Test write then parse preserves all data."""
-        output_file = temp_dir / "roundtrip.atrb"
+        buffer = io.StringIO()
 
-        AtrbWriter.write_file(simple_document, output_file)
-        reloaded = AtrbParser.parse_file(output_file)
+        AtrbWriter.write_stream(simple_document, buffer)
+        buffer.seek(0)
+        reloaded = AtrbParser.parse_stream(buffer)
 
         assert reloaded.name == simple_document.name
         assert reloaded.version == simple_document.version
         assert len(reloaded.content) == len(simple_document.content)
+        assert reloaded == simple_document
 
-    def test_dependency_string_preserved(self):
+    def test_dependency_string_preserved(self, make_document, yaml_load):
         """Test dependency fields preserved as string '{}'."""
-        from pytuin_desktop.models import ScriptBlock
-        from pytuin_desktop.models.props import ScriptProps
-
-        doc = AtrbDocument(
-            id=uuid4(),
-            name="Test",
-            version=1,
-            content=[
-                ScriptBlock(
-                    id=uuid4(),
-                    props=ScriptProps(
-                        name="Test Script",
-                        code="echo test",
-                        interpreter="/bin/bash",
-                        outputVariable="",
-                        outputVisible=True,
-                        dependency="{}",
-                    ),
-                )
-            ],
+        doc = make_document(
+            ScriptBlock(
+                id=uuid4(),
+                props=ScriptProps(
+                    name="Test Script",
+                    code="echo test",
+                    interpreter="/bin/bash",
+                    outputVariable="",
+                    outputVisible=True,
+                    dependency="{}",
+                ),
+            )
         )
 
         yaml_str = AtrbWriter.to_string(doc)
-        parsed = yaml.safe_load(yaml_str)
+        parsed = yaml_load(yaml_str)
 
         assert parsed["content"][0]["props"]["dependency"] == "{}"
+
+    def test_nested_dependency_serialized_as_string(self, make_document, yaml_load):
+        """Test dependency fields inside nested children are serialized as strings."""
+        inner = BlockBuilder.toggle_item(
+            "Inner", children=[BlockBuilder.script(name="Nested Script")]
+        )
+        doc = make_document(BlockBuilder.toggle_item("Outer", children=[inner]))
+
+        parsed = yaml_load(AtrbWriter.to_string(doc))
+
+        script = parsed["content"][0]["children"][0]["children"][0]
+        assert script["props"]["dependency"] == "{}"
+        assert list(script) == ["id", "type", "props", "children"]